@@ -49,7 +49,7 @@ async def wait_for_sandbox_deployed(sandbox_name: str, max_attempts: int = 30) -
     return False
 
 
-async def wait_for_sandbox_deletion(sandbox_name: str, max_attempts: int = 30) -> bool:
+async def wait_for_sandbox_deletion(sandbox_name: str, timeout: float = 30) -> bool:
     """
     Wait for a sandbox deletion to complete by polling until the sandbox either
     (a) no longer exists (GET raises) or (b) has transitioned to the
@@ -57,24 +57,36 @@ async def wait_for_sandbox_deletion(sandbox_name: str, max_attempts: int = 30) -
     (see ``SandboxInstance.create_if_not_exists``). This avoids waiting for the
     backend tombstone after the sandbox is already semantically gone.
 
+    Polls with exponential backoff (50ms doubling up to 1s) since most
+    deletions complete well under a second. Each probe is bounded by the
+    remaining budget, so a slow API cannot stretch the wait past ``timeout``.
+
     Args:
         sandbox_name: The name of the sandbox to wait for deletion
-        max_attempts: Maximum number of attempts to wait (default: 30 seconds)
+        timeout: Maximum time to wait in seconds (default: 30 seconds)
 
     Returns:
         True if deletion completed, False if timeout
     """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
     attempts = 0
 
-    while attempts < max_attempts:
+    while (remaining := deadline - loop.time()) > 0:
         try:
-            sandbox = await SandboxInstance.get(sandbox_name)
+            sandbox = await asyncio.wait_for(
+                SandboxInstance.get(sandbox_name), timeout=min(remaining, 2.0)
+            )
             if getattr(sandbox, "status", None) == "TERMINATED":
                 return True
-            await async_sleep(1)
-            attempts += 1
+        except asyncio.TimeoutError:
+            # A slow probe says nothing about the deletion state; back off and retry
+            pass
         except Exception:
             return True
+        delay = min(1.0, 0.05 * (2**attempts))
+        await async_sleep(min(deadline - loop.time(), delay))
+        attempts += 1
 
     print(f"Timeout waiting for {sandbox_name} deletion to complete")
     return False
@@ -7,15 +7,14 @@ TypeScript SDK so tests can be ported 1:1.
 from __future__ import annotations
 
 import json
-import os
 
 from blaxel.core.client.types import Unset
+from tests.helpers import env
 
 # The proxy/network routing feature is only available in specific regions, so
 # these tests override ``tests.helpers.default_region`` (which points at
 # ``us-pdx-1``) to keep creating sandboxes in ``us-was-1`` on prod.
-_env = os.environ.get("BL_ENV", "prod")
-default_region = "eu-dub-1" if _env == "dev" else "us-was-1"
+default_region = "eu-dub-1" if env == "dev" else "us-was-1"
 
 PROXY_HELPER_SCRIPT = r"""
 const https = require("https");
@@ -96,5 +96,5 @@ async def test_deletes_sandbox_with_proxy_configuration():
     )
 
     await SandboxInstance.delete(name)
-    deleted = await wait_for_sandbox_deletion(name, max_attempts=60)
+    deleted = await wait_for_sandbox_deletion(name, timeout=60)
     assert deleted is True
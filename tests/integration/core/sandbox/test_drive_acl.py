@@ -15,7 +15,6 @@ executionplane#171).
 """
 
 import asyncio
-import os
 
 import pytest
 import pytest_asyncio
@@ -30,11 +29,12 @@ from blaxel.core.sandbox import SandboxInstance
 from tests.helpers import (
     default_image,
     default_labels,
+    env,
     unique_name,
     wait_for_sandbox_deletion,
 )
 
-default_region = "eu-dub-1" if os.environ.get("BL_ENV") == "dev" else "us-was-1"
+default_region = "eu-dub-1" if env == "dev" else "us-was-1"
 
 MOUNT_SETTLE_S = 3
 
@@ -1,5 +1,4 @@
 import asyncio
-import os
 import time
 
 import pytest
@@ -10,11 +9,12 @@ from blaxel.core.sandbox import SandboxInstance
 from tests.helpers import (
     default_image,
     default_labels,
+    env,
     unique_name,
     wait_for_sandbox_deletion,
 )
 
-default_region = "us-was-1" if os.environ.get("BL_ENV") != "dev" else "eu-dub-1"
+default_region = "us-was-1" if env != "dev" else "eu-dub-1"
 
 
 class TestDriveOperations:
@@ -1,5 +1,4 @@
 import asyncio
-import os
 
 import httpx
 import pytest
@@ -7,10 +6,10 @@ import pytest_asyncio
 
 from blaxel.core.sandbox import SandboxInstance
 from blaxel.core.sandbox.client.models import HealthResponse
-from tests.helpers import default_labels, default_region, unique_name
+from tests.helpers import default_labels, default_region, env, unique_name
 
 # Environment-aware version
-VERSION = "develop" if os.environ.get("BL_ENV") == "dev" else "latest"
+VERSION = "develop" if env == "dev" else "latest"
 
 
 async def wait_for_upgrade_complete(
@@ -28,15 +27,22 @@ async def wait_for_upgrade_complete(
     retries = 0
     health_data = None
     deadline = asyncio.get_running_loop().time() + max_wait_time
+    # Only log progress every few seconds or when the upgrade count changes
+    log_interval = 5.0
+    last_log = -log_interval
+    last_upgrade_count = None
 
     while asyncio.get_running_loop().time() < deadline:
         try:
             health_data = await sandbox.system.health()
             upgrade_count = health_data.upgrade_count or 0
             elapsed = max_wait_time - (deadline - asyncio.get_running_loop().time())
-            print(
-                f"[TEST] Health check - upgradeCount: {upgrade_count} (elapsed: {elapsed * 1000:.0f}ms)"
-            )
+            if upgrade_count != last_upgrade_count or elapsed - last_log >= log_interval:
+                print(
+                    f"[TEST] Health check - upgradeCount: {upgrade_count} (elapsed: {elapsed * 1000:.0f}ms)"
+                )
+                last_log = elapsed
+                last_upgrade_count = upgrade_count
             if upgrade_count > 0:
                 print(f"[TEST] Upgrade completed (took {elapsed * 1000:.0f}ms)")
                 return health_data
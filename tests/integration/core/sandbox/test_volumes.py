@@ -1,4 +1,5 @@
 import asyncio
+import shlex
 import time
 
 import pytest
@@ -15,6 +16,14 @@ from tests.helpers import (
     wait_for_volume_deletion,
 )
 
+# Prints the used percentage of the filesystem mounted at /data
+_DISK_USAGE_CMD = "df /data | tail -1 | awk '{print $5}' | sed 's/%//'"
+
+
+def _logs(result) -> str:
+    """Return the stripped logs of a process result."""
+    return (result.logs or "").strip()
+
 
 class TestVolumeOperations:
     """Base class for volume tests with cleanup tracking."""
@@ -43,11 +52,15 @@ class TestVolumeOperations:
             return_exceptions=True,
         )
 
+    async def _delete_sandbox(self, name: str) -> bool:
+        """Delete a sandbox and wait for the deletion to complete."""
+        await SandboxInstance.delete(name)
+        return await wait_for_sandbox_deletion(name)
+
     async def _safe_delete_sandbox(self, name: str) -> None:
         """Safely delete a sandbox, ignoring errors."""
         try:
-            await SandboxInstance.delete(name)
-            await wait_for_sandbox_deletion(name)
+            await self._delete_sandbox(name)
         except Exception:
             pass
 
@@ -185,22 +198,15 @@ class TestMountingVolumesToSandboxes(TestVolumeOperations):
         )
         self.created_sandboxes.append(sandbox_name)
 
-        # Verify mount by writing a file
-        await sandbox.process.exec(
-            {
-                "command": "echo 'mounted' > /data/test.txt",
-                "wait_for_completion": True,
-            }
-        )
-
+        # Verify mount by writing a file and reading it back in one exec
         result = await sandbox.process.exec(
             {
-                "command": "cat /data/test.txt",
+                "command": "echo 'mounted' > /data/test.txt && cat /data/test.txt",
                 "wait_for_completion": True,
             }
         )
 
-        assert "mounted" in result.logs
+        assert "mounted" in _logs(result)
 
 
 @pytest.mark.asyncio(loop_scope="class")
@@ -235,43 +241,45 @@ class TestVolumeResize(TestVolumeOperations):
                 "labels": default_labels,
             }
         )
+        self.created_sandboxes.append(sandbox1_name)
 
-        # Write ~400MB of data to the volume
+        # Write ~400MB of data to the volume, flushed before the sandbox goes away
         await sandbox1.process.exec(
             {
-                "command": "dd if=/dev/urandom of=/data/large-file-1.bin bs=1M count=400",
+                "command": "dd if=/dev/urandom of=/data/large-file-1.bin bs=1M count=400 conv=fsync",
                 "wait_for_completion": True,
             }
         )
 
-        # Verify file was created
-        check_result1 = await sandbox1.process.exec(
-            {
-                "command": "ls -lh /data/large-file-1.bin",
-                "wait_for_completion": True,
-            }
+        # Verify file was created and capture disk usage on the 512MB volume so
+        # we can later assert the resize actually took effect (usage should drop
+        # on the 1GB volume). Both probes are independent, so run them together.
+        check_result1, disk_check1 = await asyncio.gather(
+            sandbox1.process.exec(
+                {
+                    "command": "ls -lh /data/large-file-1.bin",
+                    "wait_for_completion": True,
+                }
+            ),
+            sandbox1.process.exec(
+                {
+                    "command": _DISK_USAGE_CMD,
+                    "wait_for_completion": True,
+                }
+            ),
         )
-        assert "large-file-1.bin" in check_result1.logs
+        assert "large-file-1.bin" in _logs(check_result1)
 
-        # Capture disk usage on the 512MB volume so we can later assert the
-        # resize actually took effect (usage should drop on the 1GB volume).
-        disk_check1 = await sandbox1.process.exec(
-            {
-                "command": "df /data | tail -1 | awk '{print $5}' | sed 's/%//'",
-                "wait_for_completion": True,
-            }
-        )
         try:
-            usage_percent1 = int(disk_check1.logs.strip())
+            usage_percent1 = int(_logs(disk_check1))
         except ValueError as e:
             raise AssertionError(
-                f"Could not parse df output for baseline disk usage: {disk_check1.logs!r}"
+                f"Could not parse df output for baseline disk usage: {_logs(disk_check1)!r}"
             ) from e
         assert usage_percent1 > 60
 
         # Delete first sandbox
-        await SandboxInstance.delete(sandbox1_name)
-        await wait_for_sandbox_deletion(sandbox1_name)
+        await self._delete_sandbox(sandbox1_name)
 
         # Resize volume to 1GB
         updated_volume = await VolumeInstance.update(volume_name, {"size": 1024})
@@ -297,7 +305,7 @@ class TestVolumeResize(TestVolumeOperations):
                 "wait_for_completion": True,
             }
         )
-        assert "large-file-1.bin" in check_result2.logs
+        assert "large-file-1.bin" in _logs(check_result2)
 
         # Poll disk usage until the resize is visible in the mounted filesystem.
         # Volume resize is event-based on the backend, so reconciliation can take
@@ -308,12 +316,12 @@ class TestVolumeResize(TestVolumeOperations):
         while time.time() < resize_deadline:
             disk_check2 = await sandbox2.process.exec(
                 {
-                    "command": "df /data | tail -1 | awk '{print $5}' | sed 's/%//'",
+                    "command": _DISK_USAGE_CMD,
                     "wait_for_completion": True,
                 }
             )
             try:
-                usage_percent2 = int(disk_check2.logs.strip())
+                usage_percent2 = int(_logs(disk_check2))
             except ValueError:
                 # Empty or malformed df output: retry rather than spin idle.
                 await asyncio.sleep(5)
@@ -326,24 +334,20 @@ class TestVolumeResize(TestVolumeOperations):
         # filesystem overhead and async reconciliation timing.
         assert usage_percent2 < usage_percent1
 
-        # Write another ~400MB file (would fail if volume wasn't resized)
-        write_result = await sandbox2.process.exec(
+        # Write another ~400MB file (would fail if volume wasn't resized), then
+        # list the volume in the same exec; the sentinel splits the two outputs.
+        result = await sandbox2.process.exec(
             {
-                "command": "dd if=/dev/urandom of=/data/large-file-2.bin bs=1M count=400 && echo 'WRITE_SUCCESS'",
+                "command": "dd if=/dev/urandom of=/data/large-file-2.bin bs=1M count=400 && echo 'WRITE_SUCCESS'; echo '---LS---'; ls -lh /data/",
                 "wait_for_completion": True,
             }
         )
-        assert "WRITE_SUCCESS" in write_result.logs
+        write_logs, _, ls_logs = _logs(result).partition("---LS---")
+        assert "WRITE_SUCCESS" in write_logs
 
         # Verify both files exist
-        final_check = await sandbox2.process.exec(
-            {
-                "command": "ls -lh /data/",
-                "wait_for_completion": True,
-            }
-        )
-        assert "large-file-1.bin" in final_check.logs
-        assert "large-file-2.bin" in final_check.logs
+        assert "large-file-1.bin" in ls_logs
+        assert "large-file-2.bin" in ls_logs
 
     async def test_fails_when_writing_more_data_than_volume_capacity(self):
         """Test that writing more data than volume capacity fails."""
@@ -384,7 +388,8 @@ class TestVolumeResize(TestVolumeOperations):
         )
 
         # The write should fail due to insufficient space
-        assert "WRITE_FAILED" in write_result.logs or "No space left on device" in write_result.logs
+        write_logs = _logs(write_result)
+        assert "WRITE_FAILED" in write_logs or "No space left on device" in write_logs
 
 
 @pytest.mark.asyncio(loop_scope="class")
@@ -406,6 +411,10 @@ class TestVolumePersistence(TestVolumeOperations):
         )
         self.created_volumes.append(volume_name)
 
+        # Volumes are attached at sandbox creation and cannot be detached from a
+        # running sandbox (only drives support mount/unmount), so persistence is
+        # checked by reading from a second sandbox rather than remounting.
+
         # First sandbox - write data
         sandbox1_name = unique_name("persist-1")
         sandbox1 = await SandboxInstance.create(
@@ -417,17 +426,23 @@ class TestVolumePersistence(TestVolumeOperations):
                 "labels": default_labels,
             }
         )
+        self.created_sandboxes.append(sandbox1_name)
 
+        # Write the file and flush it to the volume so the data is durable
+        # before the sandbox is deleted; the second sandbox verifies it
         await sandbox1.process.exec(
             {
-                "command": f"echo '{file_content}' > /persistent/data.txt",
+                "command": f"printf '%s\\n' {shlex.quote(file_content)} > /persistent/data.txt"
+                " && sync",
                 "wait_for_completion": True,
             }
         )
 
-        # Delete first sandbox and wait for full deletion
-        await SandboxInstance.delete(sandbox1_name)
-        await wait_for_sandbox_deletion(sandbox1_name)
+        # Delete first sandbox and wait for full deletion. Do not overlap this
+        # with creating the second sandbox: until the first one is gone it still
+        # holds the volume, and a read through two live mounts would not prove
+        # the data survived teardown.
+        await self._delete_sandbox(sandbox1_name)
 
         # Second sandbox - read data
         sandbox2_name = unique_name("persist-2")
@@ -449,4 +464,4 @@ class TestVolumePersistence(TestVolumeOperations):
             }
         )
 
-        assert result.logs.strip() == file_content
+        assert _logs(result) == file_content